@@ -6,16 +6,35 @@ This script scans Android resource files (strings.xml) for string and plural res
 reports missing translations, and can automatically translate missing entries using OpenAI.
 """
 
+import io
 import logging
 import sys
 import re
+import threading
 import os
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from collections import defaultdict
-from typing import Any, Dict, Set, List, Tuple, Optional, Union
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    NamedTuple,
+    Set,
+    List,
+    Mapping,
+    Tuple,
+    Optional,
+    Union,
+)
 from lxml import etree
 from language_utils import get_language_name
 from string_utils import escape_special_chars
@@ -42,8 +61,14 @@ from llm_provider import (
 
 # Maximum number of items to translate in a single batch API call
 MAX_BATCH_SIZE = 100
+# Maximum number of languages translated concurrently (bounds in-flight API calls)
+MAX_TRANSLATION_WORKERS = 8
 # Default number of existing translation pairs/plurals to include as context
 DEFAULT_REFERENCE_CONTEXT_LIMIT = 25
+# Default location of the on-disk translation cache for command-line runs
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "android_resource_translator"
+)
 
 TRANSLATION_GUIDELINES = """\
 Follow these guidelines carefully.
@@ -156,6 +181,45 @@ _STANDARD_LOCALE_QUALIFIER_PATTERN = re.compile(
 _BCP47_LOCALE_QUALIFIER_PATTERN = re.compile(
     r"^b\+[A-Za-z]{2,3}(?:\+[A-Za-z]{4})?(?:\+(?:[A-Z]{2}|\d{3}))?$"
 )
+# Leading newline plus indentation in an element tail, used to detect a file's indent
+_INDENT_PATTERN = re.compile(r"\n(\s+)")
+# Comma separator (with surrounding whitespace) in comma separated inputs
+_CSV_SEPARATOR_PATTERN = re.compile(r"\s*,\s*")
+
+# Top-level <string>/<plurals> children not marked translatable="false" (any case)
+_TRANSLATABLE_RESOURCES_XPATH = etree.XPath(
+    "(string | plurals)[not(translate(@translatable, 'FALSE', 'false') = 'false')]"
+)
+
+# XML declaration written ahead of updated resource files (Android's double-quoted style)
+_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+# Markdown table headers repeated for every language and plural in the report
+_STRING_TABLE_HEADER = (
+    "| Key | Source Text | Translated Text |\n| --- | ----------- | --------------- |\n"
+)
+_PLURAL_TABLE_HEADER = (
+    "| Quantity | Translated Text |\n| -------- | --------------- |\n"
+)
+# Bound formatters for the report's table rows
+_STRING_ROW_FORMAT = "| {} | {} | {} |\n".format
+_PLURAL_ROW_FORMAT = "| {} | {} |\n".format
+# Line breaks would end a Markdown table row early, so report cells flatten them
+_NEWLINE_TRANS = str.maketrans({"\n": " ", "\r": " "})
+# Field extractors for translation log entries
+_STRING_ENTRY_FIELDS = itemgetter("key", "source", "translation")
+_PLURAL_ENTRY_FIELDS = itemgetter("plural_name", "translations")
+
+# Tool metadata folders that never hold project resources; the scan never enters them
+_SKIPPED_TOOLING_DIRECTORIES = frozenset({".git", ".gradle", ".idea"})
+
+# Upper bound on threads used to parse resource files concurrently. Parsing is
+# mostly file I/O and lxml's C parser (which releases the GIL), so threads scale.
+MAX_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Upper bound on resource roots scanned at once. Each scan parses its files on
+# its own pool of MAX_PARSE_WORKERS threads, so this multiplies with that limit.
+MAX_ROOT_SCAN_WORKERS = 4
 
 
 @dataclass
@@ -180,6 +244,30 @@ def _create_secure_fragment_parser() -> etree.XMLParser:
     )
 
 
+# Per-thread lxml parsers. A parser is reusable across documents, but lxml
+# serializes concurrent use of one instance, so each worker thread keeps its own.
+_THREAD_LOCAL_PARSERS = threading.local()
+
+
+def _get_thread_parser(kind: str) -> etree.XMLParser:
+    """
+    Return this thread's parser for the given kind, creating it on first use.
+
+    Kinds:
+      - "document": whitespace-preserving parser for strings.xml files on disk
+      - "secure": parser that does not resolve entities or load DTDs, for
+        translated fragments and file contents read from git
+    """
+    parser = getattr(_THREAD_LOCAL_PARSERS, kind, None)
+    if parser is None:
+        if kind == "document":
+            parser = etree.XMLParser(remove_blank_text=False)
+        else:
+            parser = _create_secure_fragment_parser()
+        setattr(_THREAD_LOCAL_PARSERS, kind, parser)
+    return parser
+
+
 def _normalize_inner_xml(text: str) -> str:
     """Normalize inner XML content for comparison."""
     if text is None:
@@ -202,29 +290,37 @@ def _serialize_inner_xml(element) -> str:
     return _normalize_inner_xml("".join(segments))
 
 
+def _add_resource_entry(
+    elem, strings: Dict[str, str], plurals: Dict[str, Dict[str, str]]
+) -> None:
+    """Record a <string> or <plurals> element unless it is marked non-translatable."""
+    if elem.get("translatable", "true").lower() == "false":
+        return
+
+    name = elem.get("name")
+    if not name:
+        return
+    # Resource names and quantities repeat in every locale; share one str per value
+    name = sys.intern(name)
+
+    if elem.tag == "string":
+        strings[name] = _serialize_inner_xml(elem)
+    elif elem.tag == "plurals":
+        quantities: Dict[str, str] = {}
+        for item in elem.iterchildren("item"):
+            quantity = item.get("quantity")
+            if quantity:
+                quantities[sys.intern(quantity)] = _serialize_inner_xml(item)
+        plurals[name] = quantities
+
+
 def _extract_resource_entries(root) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
     """Extract translatable string and plural entries from a resources root."""
     strings: Dict[str, str] = {}
     plurals: Dict[str, Dict[str, str]] = {}
 
-    for elem in root:
-        translatable = elem.attrib.get("translatable", "true").lower()
-        if translatable == "false":
-            continue
-
-        if elem.tag == "string":
-            name = elem.attrib.get("name")
-            if name:
-                strings[name] = _serialize_inner_xml(elem)
-        elif elem.tag == "plurals":
-            name = elem.attrib.get("name")
-            if name:
-                quantities: Dict[str, str] = {}
-                for item in elem.findall("item"):
-                    quantity = item.attrib.get("quantity")
-                    if quantity:
-                        quantities[quantity] = _serialize_inner_xml(item)
-                plurals[name] = quantities
+    for elem in _TRANSLATABLE_RESOURCES_XPATH(root):
+        _add_resource_entry(elem, strings, plurals)
 
     return strings, plurals
 
@@ -234,12 +330,7 @@ def _parse_resource_xml_content(
 ) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
     """Parse strings.xml content loaded from a source other than the filesystem."""
     try:
-        parser = etree.XMLParser(
-            remove_blank_text=False,
-            resolve_entities=False,
-            no_network=True,
-        )
-        root = etree.fromstring(content, parser=parser)
+        root = etree.fromstring(content, parser=_get_thread_parser("secure"))
         return _extract_resource_entries(root)
     except etree.XMLSyntaxError as pe:
         logger.warning(f"XML parse error in previous version of {path_label}: {pe}")
@@ -263,9 +354,9 @@ def _set_element_inner_xml(element, content: str) -> None:
         return
 
     try:
-        parser = _create_secure_fragment_parser()
         wrapper = etree.fromstring(
-            f"<__wrapper__>{content}</__wrapper__>", parser=parser
+            f"<__wrapper__>{content}</__wrapper__>",
+            parser=_get_thread_parser("secure"),
         )
     except etree.XMLSyntaxError:
         element.text = content
@@ -277,6 +368,13 @@ def _set_element_inner_xml(element, content: str) -> None:
         element.append(child)
 
 
+def _split_csv_input(value: Optional[str]) -> List[str]:
+    """Split a comma separated input into trimmed, non-empty items."""
+    if not value:
+        return []
+    return [item for item in _CSV_SEPARATOR_PATTERN.split(value.strip()) if item]
+
+
 def configure_logging(trace: bool) -> None:
     """Configure logging to console and optionally to a file."""
     log_level = logging.DEBUG if trace else logging.INFO
@@ -320,6 +418,8 @@ class AndroidResourceFile:
     Represents a strings.xml file in an Android project containing <string> and <plurals> resources.
     """
 
+    __slots__ = ("language", "modified", "path", "plurals", "strings")
+
     def __init__(self, path: Path, language: str = "default") -> None:
         self.path: Path = path
         self.language: str = language
@@ -331,12 +431,30 @@ class AndroidResourceFile:
     def parse_file(self) -> None:
         """Parses the strings.xml file and extracts <string> and <plurals> elements. Skips resources with translatable="false"."""
         try:
-            parser = etree.XMLParser(remove_blank_text=False)
-            tree = etree.parse(str(self.path), parser)
-            root = tree.getroot()
-            self.strings, self.plurals = _extract_resource_entries(root)
+            strings: Dict[str, str] = {}
+            plurals: Dict[str, Dict[str, str]] = {}
+            # Stream the document and drop each resource once it has been read so
+            # that large strings.xml files never have to be held as a full tree.
+            for _, elem in etree.iterparse(
+                str(self.path),
+                events=("end",),
+                tag=("string", "plurals"),
+                remove_blank_text=False,
+            ):
+                parent = elem.getparent()
+                # Only top-level resources count; nested matches are handled with their parent.
+                if parent is None or parent.getparent() is not None:
+                    continue
+                _add_resource_entry(elem, strings, plurals)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+            self.strings, self.plurals = strings, plurals
             logger.debug(
-                f"Parsed {len(self.strings)} strings and {len(self.plurals)} plurals from {self.path}"
+                "Parsed %d strings and %d plurals from %s",
+                len(self.strings),
+                len(self.plurals),
+                self.path,
             )
         except etree.XMLSyntaxError as pe:
             logger.error(f"XML parse error in {self.path}: {pe}")
@@ -355,6 +473,8 @@ class AndroidModule:
     Represents an Android module containing several strings.xml files for different languages.
     """
 
+    __slots__ = ("identifier", "language_resources", "name")
+
     def __init__(self, name: str, identifier: str = None) -> None:
         self.name: str = name
         # Unique identifier so that modules in different locations are not merged if they share the same short name.
@@ -365,7 +485,10 @@ class AndroidModule:
 
     def add_resource(self, language: str, resource: AndroidResourceFile) -> None:
         logger.debug(
-            f"Added resource for '{language}' in module '{self.name}': {resource.path.name}"
+            "Added resource for '%s' in module '%s': %s",
+            language,
+            self.name,
+            resource.path.name,
         )
         self.language_resources[language].append(resource)
 
@@ -375,7 +498,11 @@ class AndroidModule:
             for resource in resources:
                 sums = resource.summary()
                 logger.debug(
-                    f"  [{language}] {resource.path} | Strings: {sums['strings']}, Plurals: {sums['plurals']}"
+                    "  [%s] %s | Strings: %d, Plurals: %d",
+                    language,
+                    resource.path,
+                    sums["strings"],
+                    sums["plurals"],
                 )
 
 
@@ -415,14 +542,13 @@ def detect_language_from_path(file_path: Path) -> str:
         return "default"
 
     # Standard pattern: values-XX
-    match = re.match(r"values-(.+)", values_dir)
-    if not match:
+    language = values_dir[7:] if values_dir.startswith("values-") else ""
+    if not language:
         raise ValueError(
             f"Invalid Android resource folder name: '{values_dir}'. "
             "Expected format 'values' or 'values-<lang>'."
         )
 
-    language = match.group(1)
     if not (
         _STANDARD_LOCALE_QUALIFIER_PATTERN.fullmatch(language)
         or _BCP47_LOCALE_QUALIFIER_PATTERN.fullmatch(language)
@@ -433,12 +559,60 @@ def detect_language_from_path(file_path: Path) -> str:
             "or 'values-b+sr+Latn'."
         )
 
-    logger.debug(f"Detected language '{language}' from {values_dir}")
-    return language
+    logger.debug("Detected language '%s' from %s", language, values_dir)
+    return sys.intern(language)
+
+
+def _scan_strings_xml_files(
+    resources_path: str, ignored_folder_names: AbstractSet[str]
+) -> List[str]:
+    """
+    Return the paths of all strings.xml files in values* folders below resources_path.
+
+    Uses os.scandir so entry types come from the directory listing itself rather
+    than an extra stat call per entry. Directories named in ignored_folder_names or
+    _SKIPPED_TOOLING_DIRECTORIES are pruned without being entered, and symlinked
+    directories are not followed.
+
+    Raises:
+        OSError: If resources_path cannot be listed (missing, not a directory,
+            unreadable). Unreadable subdirectories are skipped.
+    """
+    xml_file_paths: List[str] = []
+    pending_directories = [resources_path]
+    while pending_directories:
+        directory = pending_directories.pop()
+        is_values_directory = os.path.basename(os.path.normpath(directory)).startswith(
+            "values"
+        )
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _SKIPPED_TOOLING_DIRECTORIES:
+                            continue
+                        if entry.name in ignored_folder_names:
+                            logger.debug(
+                                "Skipping %s (matched ignore_folders)", entry.path
+                            )
+                        else:
+                            subdirectories.append(entry.path)
+                    elif is_values_directory and entry.name == "strings.xml":
+                        xml_file_paths.append(entry.path)
+        except OSError as e:
+            # Only the root must be listable; nested failures are skipped
+            if directory is resources_path:
+                raise
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
+            continue
+        # Depth-first, visiting subdirectories in listing order
+        pending_directories.extend(reversed(subdirectories))
+    return xml_file_paths
 
 
 def find_resource_files(
-    resources_path: str, ignore_folders: List[str] = None
+    resources_path: str, ignore_folders: Optional[AbstractSet[str]] = None
 ) -> Dict[str, AndroidModule]:
     """
     Recursively search for and organize Android string resource files by module.
@@ -458,13 +632,15 @@ def find_resource_files(
 
     Args:
         resources_path: Path to the root directory to scan for resources
-        ignore_folders: Optional list of folder names to ignore during scanning
+        ignore_folders: Optional set of folder names to ignore during scanning
 
     Returns:
         Dictionary mapping module identifiers to AndroidModule objects containing
         the resource files organized by language
 
     Raises:
+        FileNotFoundError: If resources_path does not exist
+        NotADirectoryError: If resources_path is not a directory
         Exception: If there's an error determining the module structure
     """
     resources_dir = Path(resources_path)
@@ -474,13 +650,18 @@ def find_resource_files(
     # Determine which files to ignore:
     # 1. Use explicit ignore_folders if provided
     # 2. Otherwise, use patterns from .gitignore files with proper precedence
+    ignored_folder_names = frozenset(ignore_folders or ())
+
+    # List the tree first so a missing or invalid root fails before any other work
+    xml_file_paths = _scan_strings_xml_files(str(resources_dir), ignored_folder_names)
+
     if ignore_folders:
-        logger.info(f"Using explicit ignore folders: {', '.join(ignore_folders)}")
-        ignored_folder_names = set(ignore_folders)
+        logger.info(
+            f"Using explicit ignore folders: {', '.join(sorted(ignore_folders))}"
+        )
         gitignore_patterns = []
         all_gitignores = {}
     else:
-        ignored_folder_names = set()
         # Find all .gitignore files in the directory hierarchy
         all_gitignores = find_all_gitignores(resources_path)
         if all_gitignores:
@@ -498,31 +679,28 @@ def find_resource_files(
             else:
                 gitignore_patterns = []
 
-    # Recursively find all strings.xml files
-    for xml_file_path in resources_dir.rglob("strings.xml"):
-        # Skip files in ignored directories
-        if ignore_folders and any(
-            path_part in ignored_folder_names for path_part in xml_file_path.parts
-        ):
-            logger.debug(f"Skipping {xml_file_path} (matched ignore_folders)")
-            continue
-        elif all_gitignores:
+    # (module key, language, path) for every resource file that should be parsed
+    pending_files: List[Tuple[str, str, Path]] = []
+    # Module folder -> resolved module key
+    resolved_module_keys: Dict[Path, str] = {}
+
+    # Filter the discovered values*/strings.xml files; ignored folders were pruned.
+    for xml_file_str in xml_file_paths:
+        xml_file_path = Path(xml_file_str)
+        if all_gitignores:
             # Use the full hierarchical gitignore implementation
             if is_ignored_by_gitignores(xml_file_path, all_gitignores):
                 logger.debug(
-                    f"Skipping {xml_file_path} (matched gitignore pattern from hierarchy)"
+                    "Skipping %s (matched gitignore pattern from hierarchy)",
+                    xml_file_path,
                 )
                 continue
         elif not ignore_folders and gitignore_patterns:
             # Use the single file gitignore implementation
             if is_ignored_by_gitignore(xml_file_path, gitignore_patterns):
-                logger.debug(f"Skipping {xml_file_path} (matched gitignore pattern)")
+                logger.debug("Skipping %s (matched gitignore pattern)", xml_file_path)
                 continue
 
-        # Process only files in "values" or "values-XX" directories
-        if not xml_file_path.parent.name.startswith("values"):
-            continue
-
         # Detect which language this resource file is for
         try:
             language = detect_language_from_path(xml_file_path)
@@ -545,19 +723,36 @@ def find_resource_files(
 
         # Use both the module name and its full path as an identifier
         # This ensures we don't merge modules with the same name from different paths
+        # All locale folders of a module share its path, so resolve it only once.
         module_name = module_path.name
-        module_key = str(module_path.resolve())
+        module_key = resolved_module_keys.get(module_path)
+        if module_key is None:
+            module_key = sys.intern(str(module_path.resolve()))
+            resolved_module_keys[module_path] = module_key
 
         # Create the module entry if it doesn't exist yet
         if module_key not in modules:
             modules[module_key] = AndroidModule(module_name, identifier=module_key)
             logger.debug(
-                f"Created module entry for '{module_name}' (key: {module_key})"
+                "Created module entry for '%s' (key: %s)", module_name, module_key
             )
 
-        # Parse and add the resource file to the appropriate module and language
-        resource_file = AndroidResourceFile(xml_file_path, language)
-        modules[module_key].add_resource(language, resource_file)
+        pending_files.append((module_key, language, xml_file_path))
+
+    if not pending_files:
+        return modules
+
+    # Parse the files concurrently, then register them in discovery order from this
+    # thread so the modules dict is never mutated by the workers.
+    workers = min(MAX_PARSE_WORKERS, len(pending_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        resource_files = executor.map(
+            lambda entry: AndroidResourceFile(entry[2], entry[1]), pending_files
+        )
+        for (module_key, language, _), resource_file in zip(
+            pending_files, resource_files
+        ):
+            modules[module_key].add_resource(language, resource_file)
 
     return modules
 
@@ -756,8 +951,8 @@ def detect_updated_default_resources(
                 if rel_path not in github_modified_paths:
                     continue
                 updated = UpdatedDefaultResources(
-                    strings=set(resource.strings.keys()),
-                    plurals=set(resource.plurals.keys()),
+                    strings=set(resource.strings),
+                    plurals=set(resource.plurals),
                 )
 
             if not updated.has_updates():
@@ -811,8 +1006,7 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
 
     try:
         # Parse the XML with a parser that preserves whitespace
-        parser = etree.XMLParser(remove_blank_text=False)
-        tree = etree.parse(str(resource.path), parser)
+        tree = etree.parse(str(resource.path), _get_thread_parser("document"))
         root = tree.getroot()
     except Exception as e:
         logger.error(f"Error reading XML file {resource.path}: {e}")
@@ -821,7 +1015,7 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
     # Detect the indentation style from the existing file (default to 4 spaces)
     sample_indent = "    "
     if len(root) > 0:
-        m = re.match(r"\n(\s+)", root[0].tail or "")
+        m = _INDENT_PATTERN.match(root[0].tail or "")
         if m:
             sample_indent = m.group(1)
 
@@ -831,15 +1025,18 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
 
     # --- Handle <string> elements ---
 
-    # Map existing string elements by name for quick lookup
-    original_root_count = len(root)
-    existing_string_elements = {
-        elem.get("name"): elem for elem in root if elem.tag == "string"
-    }
+    # Map existing string and plurals elements by name in a single sweep
+    existing_string_elements = {}
+    existing_plural_elements = {}
+    for elem in root.iterchildren("string", "plurals"):
+        if elem.tag == "string":
+            existing_string_elements[elem.get("name")] = elem
+        else:
+            existing_plural_elements[elem.get("name")] = elem
 
     # Ensure consistent formatting between elements
-    if original_root_count > 0:
-        last_original = root[original_root_count - 1]
+    if len(root) > 0:
+        last_original = root[-1]
         if not last_original.tail or not last_original.tail.endswith(sample_indent):
             last_original.tail = "\n" + sample_indent
 
@@ -852,7 +1049,7 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
             if _normalize_inner_xml(current_value) != normalized_translation:
                 _set_element_inner_xml(existing_string_elements[key], translation)
                 logger.debug(
-                    f"Updated <string name='{key}'> element in {resource.path}"
+                    "Updated <string name='%s'> element in %s", key, resource.path
                 )
         else:
             # Create and append a new string element
@@ -860,15 +1057,12 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
             _set_element_inner_xml(new_elem, translation)
             new_elem.tail = "\n" + sample_indent
             root.append(new_elem)
-            logger.debug(f"Appended <string name='{key}'> element to {resource.path}")
+            logger.debug(
+                "Appended <string name='%s'> element to %s", key, resource.path
+            )
 
     # --- Handle <plurals> elements ---
 
-    # Map existing plurals elements by name
-    existing_plural_elements = {
-        elem.get("name"): elem for elem in root if elem.tag == "plurals"
-    }
-
     # Process each plural resource
     for plural_name, items in resource.plurals.items():
         # Get or create the plural element
@@ -886,7 +1080,7 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
 
         # Map existing item elements by quantity
         existing_quantity_items = {
-            child.get("quantity"): child for child in plural_elem if child.tag == "item"
+            child.get("quantity"): child for child in plural_elem.iterchildren("item")
         }
 
         # Process each quantity variation
@@ -897,7 +1091,10 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
                 if _normalize_inner_xml(current_value) != normalized_translation:
                     _set_element_inner_xml(existing_quantity_items[qty], translation)
                     logger.debug(
-                        f"Updated plural '{plural_name}' quantity '{qty}' in {resource.path}"
+                        "Updated plural '%s' quantity '%s' in %s",
+                        plural_name,
+                        qty,
+                        resource.path,
                     )
             else:
                 # Create and append a new item element
@@ -906,7 +1103,10 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
                 new_item.tail = "\n" + item_indent
                 plural_elem.append(new_item)
                 logger.debug(
-                    f"Added plural '{plural_name}' quantity '{qty}' to {resource.path}"
+                    "Added plural '%s' quantity '%s' to %s",
+                    plural_name,
+                    qty,
+                    resource.path,
                 )
 
         # Ensure proper formatting for the last item in a plurals element
@@ -918,28 +1118,17 @@ def update_xml_file(resource: AndroidResourceFile) -> None:
         root[-1].tail = "\n"
 
     try:
-        # Serialize and write the XML back to the file
+        # Serialize the document and write it back in a single pass. The XML
+        # declaration is emitted directly to keep Android's double-quoted style.
         xml_bytes = etree.tostring(
-            tree, encoding="utf-8", xml_declaration=True, pretty_print=True
+            tree, encoding="utf-8", xml_declaration=False, pretty_print=True
         )
         xml_bytes = xml_bytes.rstrip(b"\n")  # Remove trailing newlines
 
         with open(resource.path, "wb") as f:
+            f.write(_XML_DECLARATION)
             f.write(xml_bytes)
 
-        # Standardize the XML declaration format
-        with open(resource.path, "r+", encoding="utf-8") as f:
-            content = f.read()
-            content = re.sub(
-                r"<\?xml version=['\"]1\.0['\"] encoding=['\"]utf-8['\"]\?>",
-                '<?xml version="1.0" encoding="utf-8"?>',
-                content,
-                flags=re.IGNORECASE,
-            )
-            f.seek(0)
-            f.write(content)
-            f.truncate()
-
         logger.info(f"Updated XML file: {resource.path}")
         resource.modified = False
     except Exception as e:
@@ -1041,6 +1230,33 @@ def _build_reference_plural_examples(
     return examples
 
 
+@cache
+def _build_translation_prompts(
+    language_name: str, project_context: str, include_plural_guidelines: bool = False
+) -> Tuple[str, str]:
+    """
+    Build the system message and base user prompt for a batch translation request.
+
+    The long translation guidelines are placed in the system message so that every
+    request for the same language starts with an identical prefix, which lets the
+    provider's prompt caching reuse it. Only the short per-request instructions go
+    into the user prompt. The result is memoized, so the guidelines are formatted
+    and concatenated once per language rather than once per resource file.
+
+    Returns:
+        A tuple of (system message, base user prompt)
+    """
+    system_message = SYSTEM_MESSAGE_TEMPLATE.format(target_language=language_name)
+    system_message += TRANSLATION_GUIDELINES
+    if include_plural_guidelines:
+        system_message += PLURAL_GUIDELINES_ADDITION
+    if project_context:
+        system_message += f"\nProject context: {project_context}"
+
+    base_prompt = TRANSLATE_FINAL_TEXT.format(target_language=language_name)
+    return system_message, base_prompt
+
+
 def _translate_missing_strings(
     res: AndroidResourceFile,
     missing_strings: set,
@@ -1050,11 +1266,16 @@ def _translate_missing_strings(
     project_context: str,
     include_reference_context: bool,
     reference_context_limit: int,
+    translation_cache: Optional[Dict[Tuple[str, str], str]] = None,
 ) -> List[Dict]:
     """
     Helper function to translate missing strings for a resource file.
     Returns a list of translation results.
 
+    Source texts already translated to the same language earlier in the run (e.g.
+    "OK" or "Cancel" repeated across modules) are reused from translation_cache
+    instead of being sent to the LLM again.
+
     Args:
         res: Resource file to update
         missing_strings: Set of missing string keys to translate
@@ -1064,25 +1285,42 @@ def _translate_missing_strings(
         project_context: Optional project context
         include_reference_context: Whether to include existing translations as context
         reference_context_limit: Maximum number of reference examples to include
+        translation_cache: Optional (source text, language) -> translation cache
 
     Returns:
         List of translation result dictionaries
     """
     results = []
 
-    # Filter out empty strings first
-    non_empty_strings = {
-        key: module_default_strings[key]
-        for key in sorted(missing_strings)
-        if module_default_strings[key].strip() != ""
-    }
-
-    # Handle empty strings separately
+    # Split out empty strings, which are copied as-is instead of being translated
+    non_empty_strings: Dict[str, str] = {}
     for key in sorted(missing_strings):
-        if module_default_strings[key].strip() == "":
-            if res.strings.get(key) != "":
-                res.strings[key] = ""
-                res.modified = True
+        source_text = module_default_strings[key]
+        if source_text.strip() != "":
+            non_empty_strings[key] = source_text
+        elif res.strings.get(key) != "":
+            res.strings[key] = ""
+            res.modified = True
+
+    # Reuse translations of identical source texts from earlier in this run
+    if translation_cache is not None:
+        for key in list(non_empty_strings):
+            cached = translation_cache.get((non_empty_strings[key].strip(), lang))
+            if cached is None:
+                continue
+            source_text = non_empty_strings.pop(key)
+            logger.info(
+                f"Reusing translation of string '{key}' to {lang}: '{source_text}' -> '{cached}'"
+            )
+            res.strings[key] = cached
+            res.modified = True
+            results.append(
+                {
+                    "key": key,
+                    "source": source_text,
+                    "translation": cached,
+                }
+            )
 
     if not non_empty_strings:
         return results
@@ -1090,16 +1328,11 @@ def _translate_missing_strings(
     # Get the language name for prompts
     language_name = get_language_name(lang)
 
-    # Build the base prompt (without specific strings)
-    base_prompt = TRANSLATION_GUIDELINES + TRANSLATE_FINAL_TEXT.format(
-        target_language=language_name
+    # Build the prompts (without specific strings)
+    system_message, base_prompt = _build_translation_prompts(
+        language_name, project_context
     )
 
-    # Configure the system message
-    system_message = SYSTEM_MESSAGE_TEMPLATE.format(target_language=language_name)
-    if project_context:
-        system_message += f"\nProject context: {project_context}"
-
     logger.info(
         f"Translating {len(non_empty_strings)} strings for {lang} using batch mode"
     )
@@ -1151,6 +1384,8 @@ def _translate_missing_strings(
                 # Update the resource
                 res.strings[key] = normalized
                 res.modified = True
+                if translation_cache is not None:
+                    translation_cache[(source_text.strip(), lang)] = normalized
 
                 # Add to results
                 results.append(
@@ -1206,18 +1441,11 @@ def _translate_missing_plurals(
     # Get the language name for prompts
     language_name = get_language_name(lang)
 
-    # Build the base prompt (without specific plurals)
-    base_prompt = (
-        TRANSLATION_GUIDELINES
-        + PLURAL_GUIDELINES_ADDITION
-        + TRANSLATE_FINAL_TEXT.format(target_language=language_name)
+    # Build the prompts (without specific plurals)
+    system_message, base_prompt = _build_translation_prompts(
+        language_name, project_context, include_plural_guidelines=True
     )
 
-    # Configure the system message
-    system_message = SYSTEM_MESSAGE_TEMPLATE.format(target_language=language_name)
-    if project_context:
-        system_message += f"\nProject context: {project_context}"
-
     logger.info(
         f"Translating {len(missing_plurals)} plurals for {lang} using batch mode"
     )
@@ -1302,7 +1530,7 @@ def _collect_default_resources(
     Collect all default string and plural resources from a module.
     """
     module_default_strings: Dict[str, str] = {}
-    module_default_plurals: Dict[str, Dict[str, str]] = defaultdict(dict)
+    module_default_plurals: Dict[str, Dict[str, str]] = {}
 
     for res in module.language_resources.get("default", []):
         # Collect strings
@@ -1311,8 +1539,9 @@ def _collect_default_resources(
 
         # Collect plurals
         for plural_name, quantities in res.plurals.items():
+            default_quantities = module_default_plurals.setdefault(plural_name, {})
             for qty, text in quantities.items():
-                module_default_plurals[plural_name].setdefault(qty, text)
+                default_quantities.setdefault(qty, text)
 
     return module_default_strings, module_default_plurals
 
@@ -1377,6 +1606,103 @@ def _module_report_key(module: AndroidModule, duplicate_names: Set[str]) -> str:
     return module.name
 
 
+@dataclass
+class _ResourceTranslationJob:
+    """Pending translation work for a single non-default resource file."""
+
+    module_name: str
+    lang: str
+    res: AndroidResourceFile
+    strings_to_translate: Set[str]
+    missing_plurals: Dict[str, Dict[str, str]]
+    updated_plurals: Set[str]
+    module_default_strings: Dict[str, str]
+    module_default_plurals: Dict[str, Dict[str, str]]
+
+
+def _run_translation_job(
+    job: _ResourceTranslationJob,
+    llm_config: LLMConfig,
+    project_context: str,
+    include_reference_context: bool,
+    reference_context_limit: int,
+    translation_cache: Dict[Tuple[str, str], str],
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Translate the missing entries of one resource file and write it back if changed.
+
+    Returns:
+        A tuple of (string results, plural results)
+    """
+    logger.info(
+        f"Auto-translating resources for module '{job.module_name}', language '{job.lang}'"
+    )
+
+    string_results: List[Dict] = []
+    plural_results: List[Dict] = []
+
+    # Translate missing strings
+    if job.strings_to_translate:
+        string_results = _translate_missing_strings(
+            job.res,
+            job.strings_to_translate,
+            job.module_default_strings,
+            job.lang,
+            llm_config,
+            project_context,
+            include_reference_context,
+            reference_context_limit,
+            translation_cache=translation_cache,
+        )
+
+    # Translate missing plurals
+    if job.missing_plurals:
+        plural_results = _translate_missing_plurals(
+            job.res,
+            job.missing_plurals,
+            job.module_default_plurals,
+            job.lang,
+            llm_config,
+            project_context,
+            include_reference_context,
+            reference_context_limit,
+            replace_existing_plurals=job.updated_plurals,
+        )
+
+    # Update the XML file if needed
+    if job.res.modified:
+        update_xml_file(job.res)
+
+    return string_results, plural_results
+
+
+def _run_language_jobs(
+    lang_jobs: List[_ResourceTranslationJob],
+    llm_config: LLMConfig,
+    project_context: str,
+    include_reference_context: bool,
+    reference_context_limit: int,
+    translation_cache: Dict[Tuple[str, str], str],
+) -> List[Tuple[List[Dict], List[Dict]]]:
+    """
+    Run the translation jobs of a single language one after another.
+
+    Keeping a language on one worker lets its jobs reuse each other's cached
+    translations deterministically.
+    """
+    return [
+        _run_translation_job(
+            job,
+            llm_config,
+            project_context,
+            include_reference_context,
+            reference_context_limit,
+            translation_cache,
+        )
+        for job in lang_jobs
+    ]
+
+
 def auto_translate_resources(
     modules: Dict[str, AndroidModule],
     llm_config: LLMConfig,
@@ -1390,6 +1716,10 @@ def auto_translate_resources(
     and refresh entries whose default source text changed.
     Returns a translation_log dictionary with details of the translations performed.
 
+    Languages are translated concurrently (up to MAX_TRANSLATION_WORKERS at a
+    time) since the work is dominated by waiting on the LLM API. Within a language,
+    identical source strings are only sent to the LLM once per run.
+
     Args:
         modules: Dictionary of Android modules to process
         llm_config: LLM provider configuration
@@ -1399,6 +1729,12 @@ def auto_translate_resources(
     total_translated = 0
     duplicate_names = _duplicate_module_names(modules)
     updated_default_resources = updated_default_resources or {}
+    # Language -> [(log entry for the module language, job)] in discovery order
+    jobs_by_lang: Dict[
+        str, List[Tuple[Dict[str, List[Dict]], _ResourceTranslationJob]]
+    ] = {}
+    # (source text, language) -> translation, shared across modules for this run
+    translation_cache: Dict[Tuple[str, str], str] = {}
 
     for module in modules.values():
         if "default" not in module.language_resources:
@@ -1416,30 +1752,22 @@ def auto_translate_resources(
         module_updates = updated_default_resources.get(
             module.identifier, UpdatedDefaultResources()
         )
+        # Changed defaults are the same for every language; filter them once per module
+        module_updated_strings = {
+            key for key in module_updates.strings if key in module_default_strings
+        }
         # Process each non-default language
         for lang, resources in module.language_resources.items():
             if lang == "default":
                 continue
 
-            module_log = translation_log.setdefault(
-                module_report_key, {"_module_name": module.name}
-            )
-            # Initialize translation log for this language
-            module_log[lang] = {
-                "strings": [],
-                "plurals": [],
-            }
+            # Created with the first job so fully translated languages stay out of the log
+            lang_log: Optional[Dict[str, List[Dict]]] = None
 
             for res in resources:
                 # Find missing translations
-                missing_strings = set(module_default_strings.keys()) - set(
-                    res.strings.keys()
-                )
-                updated_strings = {
-                    key
-                    for key in module_updates.strings
-                    if key in module_default_strings and key in res.strings
-                }
+                missing_strings = module_default_strings.keys() - res.strings.keys()
+                updated_strings = module_updated_strings & res.strings.keys()
                 strings_to_translate = missing_strings | updated_strings
 
                 # Find missing plurals
@@ -1466,46 +1794,60 @@ def auto_translate_resources(
                 if not strings_to_translate and not missing_plurals:
                     continue
 
-                logger.info(
-                    f"Auto-translating resources for module '{module.name}', language '{lang}'"
-                )
-
-                # Translate missing strings
-                if strings_to_translate:
-                    string_results = _translate_missing_strings(
-                        res,
-                        strings_to_translate,
-                        module_default_strings,
-                        lang,
-                        llm_config,
-                        project_context,
-                        include_reference_context,
-                        reference_context_limit,
-                    )
-                    module_log[lang]["strings"].extend(string_results)
-                    total_translated += len(string_results)
-
-                # Translate missing plurals
-                if missing_plurals:
-                    plural_results = _translate_missing_plurals(
-                        res,
-                        missing_plurals,
-                        module_default_plurals,
-                        lang,
-                        llm_config,
-                        project_context,
-                        include_reference_context,
-                        reference_context_limit,
-                        replace_existing_plurals=updated_plurals,
+                if lang_log is None:
+                    module_log = translation_log.setdefault(
+                        module_report_key, {"_module_name": module.name}
                     )
-                    module_log[lang]["plurals"].extend(plural_results)
-                    total_translated += sum(
-                        len(p["translations"]) for p in plural_results
+                    lang_log = module_log[lang] = {"strings": [], "plurals": []}
+
+                jobs_by_lang.setdefault(lang, []).append(
+                    (
+                        lang_log,
+                        _ResourceTranslationJob(
+                            module_name=module.name,
+                            lang=lang,
+                            res=res,
+                            strings_to_translate=strings_to_translate,
+                            missing_plurals=missing_plurals,
+                            updated_plurals=updated_plurals,
+                            module_default_strings=module_default_strings,
+                            module_default_plurals=module_default_plurals,
+                        ),
                     )
+                )
 
-                # Update the XML file if needed
-                if res.modified:
-                    update_xml_file(res)
+    if jobs_by_lang:
+        workers = min(MAX_TRANSLATION_WORKERS, len(jobs_by_lang))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_language_jobs,
+                    [job for _, job in lang_jobs],
+                    llm_config,
+                    project_context,
+                    include_reference_context,
+                    reference_context_limit,
+                    translation_cache,
+                )
+                for lang_jobs in jobs_by_lang.values()
+            ]
+            try:
+                # Collect results in discovery order so the log stays deterministic
+                for lang_jobs, future in zip(jobs_by_lang.values(), futures):
+                    for (lang_log, _), (string_results, plural_results) in zip(
+                        lang_jobs, future.result()
+                    ):
+                        lang_log["strings"].extend(string_results)
+                        lang_log["plurals"].extend(plural_results)
+                        total_translated += len(string_results)
+                        total_translated += sum(
+                            len(p["translations"]) for p in plural_results
+                        )
+            except Exception:
+                # Don't start any more API calls once one language has failed
+                for future in futures:
+                    future.cancel()
+                raise
 
     # Generate summary
     _generate_translation_summary(translation_log, total_translated)
@@ -1530,20 +1872,10 @@ def _collect_default_translations(
     Returns:
         A tuple containing (set of string keys, dict of plural name -> quantities)
     """
-    default_strings: Set[str] = set()
-    default_plural_quantities: Dict[str, Set[str]] = {}
-
     if "default" not in module.language_resources:
-        return default_strings, default_plural_quantities
+        return set(), {}
 
-    for resource in module.language_resources["default"]:
-        default_strings.update(resource.strings.keys())
-        for plural_name, quantities in resource.plurals.items():
-            default_plural_quantities.setdefault(plural_name, set()).update(
-                quantities.keys()
-            )
-
-    return default_strings, default_plural_quantities
+    return _collect_language_translations(module.language_resources["default"])
 
 
 def _collect_language_translations(
@@ -1558,15 +1890,14 @@ def _collect_language_translations(
     Returns:
         A tuple containing (set of string keys, dict of plural name -> quantities)
     """
-    lang_strings: Set[str] = set()
-    lang_plural_quantities: Dict[str, Set[str]] = {}
+    lang_strings: Set[str] = set(
+        chain.from_iterable(resource.strings for resource in resources)
+    )
+    lang_plural_quantities: Dict[str, Set[str]] = defaultdict(set)
 
     for resource in resources:
-        lang_strings.update(resource.strings.keys())
         for plural_name, quantities in resource.plurals.items():
-            lang_plural_quantities.setdefault(plural_name, set()).update(
-                quantities.keys()
-            )
+            lang_plural_quantities[plural_name].update(quantities)
 
     return lang_strings, lang_plural_quantities
 
@@ -1613,6 +1944,8 @@ def check_missing_translations(modules: Dict[str, AndroidModule]) -> dict:
     missing_count = 0
     missing_report = {}
     duplicate_names = _duplicate_module_names(modules)
+    # The per-language lines sort and join every missing key; skip them when unused
+    log_details = logger.isEnabledFor(logging.INFO)
 
     for module in modules.values():
         module_has_missing = False
@@ -1640,12 +1973,11 @@ def check_missing_translations(modules: Dict[str, AndroidModule]) -> dict:
 
             # Find what's missing
             missing_strings = default_strings - lang_strings
-            missing_plural_groups: Set[str] = set()
-
-            for plural_name in default_plural_quantities:
-                current_qty = lang_plural_quantities.get(plural_name, set())
-                if not current_qty:
-                    missing_plural_groups.add(plural_name)
+            missing_plural_groups: Set[str] = {
+                plural_name
+                for plural_name in default_plural_quantities
+                if not lang_plural_quantities.get(plural_name)
+            }
 
             # Log and report if anything is missing
             if missing_strings or missing_plural_groups:
@@ -1653,15 +1985,19 @@ def check_missing_translations(modules: Dict[str, AndroidModule]) -> dict:
                 module_has_missing = True
 
                 # Format for logging
-                missing_description = _format_missing_translations(
-                    missing_strings, missing_plural_groups
-                )
-                module_log_lines.append(f"  [{lang}]: missing {missing_description}")
+                if log_details:
+                    missing_description = _format_missing_translations(
+                        missing_strings, missing_plural_groups
+                    )
+                    module_log_lines.append(
+                        f"  [{lang}]: missing {missing_description}"
+                    )
 
                 # Add to the report dictionary
-                if module_report_key not in missing_report:
-                    missing_report[module_report_key] = {"_module_name": module.name}
-                missing_report[module_report_key][lang] = {
+                module_report = missing_report.setdefault(
+                    module_report_key, {"_module_name": module.name}
+                )
+                module_report[lang] = {
                     "strings": list(missing_strings),
                     "plural_groups": sorted(missing_plural_groups),
                     "plurals": {},
@@ -1685,67 +2021,75 @@ def check_missing_translations(modules: Dict[str, AndroidModule]) -> dict:
 # ------------------------------------------------------------------------------
 
 
-def create_translation_report(translation_log):
+def _emit_translation_report(translation_log, write: Callable[[str], Any]) -> None:
     """
-    Generate a Markdown formatted translation report as a string.
+    Write a Markdown formatted translation report piece by piece through write.
     """
-    report = "# Translation Report\n\n"
+    write("# Translation Report\n\n")
     has_translations = False
 
     for module_identifier, languages in translation_log.items():
-        module_has_translations = False
+        # Languages that contributed rows; modules without any are left out
+        active_languages = []
+        for lang, details in languages.items():
+            if lang == "_module_name":
+                continue
+            strings = details.get("strings")
+            plurals = details.get("plurals")
+            if strings or plurals:
+                active_languages.append((lang, strings, plurals))
+        if not active_languages:
+            continue
+
+        has_translations = True
         module_name = languages.get("_module_name", module_identifier)
         if module_name == module_identifier:
             module_heading = module_name
         else:
             module_heading = f"{module_name} ({module_identifier})"
+        write(f"## Module: {module_heading}\n\n")
 
-        module_report = f"## Module: {module_heading}\n\n"
-        languages_report = ""
-
-        for lang, details in languages.items():
-            if lang == "_module_name":
-                continue
-            has_string_translations = bool(details.get("strings"))
-            has_plural_translations = bool(details.get("plurals"))
-
-            if not (has_string_translations or has_plural_translations):
-                continue
-
-            module_has_translations = True
-            has_translations = True
+        # Sort languages and entries so the report does not depend on scan order or
+        # on which translations were reused from the in-run cache
+        for lang, strings, plurals in sorted(active_languages, key=itemgetter(0)):
             # Get the language name from the code (will return lang code if name not found)
             lang_name = get_language_name(lang)
-            languages_report += f"### Language: {lang_name}\n\n"
-
-            if has_string_translations:
-                languages_report += "| Key | Source Text | Translated Text |\n"
-                languages_report += "| --- | ----------- | --------------- |\n"
-                for entry in details["strings"]:
-                    key = entry["key"]
-                    source = entry["source"].replace("\n", " ")
-                    translation = entry["translation"].replace("\n", " ")
-                    languages_report += f"| {key} | {source} | {translation} |\n"
-                languages_report += "\n"
-
-            if has_plural_translations:
-                languages_report += "#### Plural Resources\n\n"
-                for plural in details["plurals"]:
-                    plural_name = plural["plural_name"]
-                    languages_report += f"**{plural_name}**\n\n"
-                    languages_report += "| Quantity | Translated Text |\n"
-                    languages_report += "| -------- | --------------- |\n"
-                    for qty, text in plural["translations"].items():
-                        languages_report += f"| {qty} | {text} |\n"
-                    languages_report += "\n"
-
-        if module_has_translations:
-            report += module_report + languages_report
+            write(f"### Language: {lang_name}\n\n")
+
+            if strings:
+                write(_STRING_TABLE_HEADER)
+                for entry in sorted(strings, key=itemgetter("key")):
+                    key, source, translation = _STRING_ENTRY_FIELDS(entry)
+                    write(
+                        _STRING_ROW_FORMAT(
+                            key,
+                            source.translate(_NEWLINE_TRANS),
+                            translation.translate(_NEWLINE_TRANS),
+                        )
+                    )
+                write("\n")
+
+            if plurals:
+                write("#### Plural Resources\n\n")
+                for plural in sorted(plurals, key=itemgetter("plural_name")):
+                    plural_name, plural_translations = _PLURAL_ENTRY_FIELDS(plural)
+                    write(f"**{plural_name}**\n\n")
+                    write(_PLURAL_TABLE_HEADER)
+                    for qty, text in plural_translations.items():
+                        write(_PLURAL_ROW_FORMAT(qty, text))
+                    write("\n")
 
     if not has_translations:
-        report += "No translations were performed."
+        write("No translations were performed.")
 
-    return report
+
+def create_translation_report(translation_log):
+    """
+    Generate a Markdown formatted translation report as a string.
+    """
+    report = io.StringIO()
+    _emit_translation_report(translation_log, report.write)
+    return report.getvalue()
 
 
 # ------------------------------------------------------------------------------
@@ -1753,77 +2097,108 @@ def create_translation_report(translation_log):
 # ------------------------------------------------------------------------------
 
 
-def main() -> None:
+class _ActionInputs(NamedTuple):
+    """Configuration parsed from the GitHub Action's environment variables."""
+
+    resources_paths: Tuple[str, ...]
+    dry_run: bool
+    log_trace: bool
+    llm_provider: str
+    model: str
+    api_key: Optional[str]
+    openrouter_site_url: str
+    openrouter_site_name: str
+    openrouter_send_site_info: bool
+    project_context: str
+    include_reference_context: bool
+    reference_context_limit: int
+    ignore_folders: FrozenSet[str]
+    cache_dir: Optional[str]
+
+
+def _parse_action_inputs(environ: Mapping[str, str]) -> _ActionInputs:
     """
-    Main entry point for the Android Resource Translator script.
-    Parses command-line arguments or environment variables, finds resource files,
-    checks for missing translations, and auto-translates them.
+    Parse the action inputs from the given environment mapping.
     """
-    is_github = os.environ.get("GITHUB_ACTIONS", "false").lower() == "true"
-    if is_github:
-        resources_paths_input = os.environ.get("INPUT_RESOURCES_PATHS")
-        resources_paths = (
-            [p.strip() for p in resources_paths_input.split(",") if p.strip()]
-            if resources_paths_input
-            else []
-        )
-        dry_run = os.environ.get("INPUT_DRY_RUN", "false").lower() == "true"
-        log_trace = os.environ.get("INPUT_LOG_TRACE", "false").lower() == "true"
+    env = environ.get
 
-        # LLM Provider configuration
-        llm_provider = os.environ.get("INPUT_LLM_PROVIDER", "openrouter").lower()
-        model = os.environ.get("INPUT_MODEL") or os.environ.get(
-            "INPUT_OPENAI_MODEL", "google/gemini-2.5-flash"
-        )  # Support legacy param
+    # LLM Provider configuration
+    llm_provider = env("INPUT_LLM_PROVIDER", "openrouter").lower()
+    model = env("INPUT_MODEL") or env(
+        "INPUT_OPENAI_MODEL", "google/gemini-2.5-flash"
+    )  # Support legacy param
 
-        # API Keys - check provider-specific key first, then fall back to OpenAI key for compatibility
-        if llm_provider == "openrouter":
-            api_key = os.environ.get("OPENROUTER_API_KEY") or os.environ.get(
-                "OPENAI_API_KEY"
-            )
-        else:
-            api_key = os.environ.get("OPENAI_API_KEY")
+    # API Keys - check provider-specific key first, then fall back to OpenAI key for compatibility
+    if llm_provider == "openrouter":
+        api_key = env("OPENROUTER_API_KEY") or env("OPENAI_API_KEY")
+    else:
+        api_key = env("OPENAI_API_KEY")
 
+    reference_context_limit_raw = env(
+        "INPUT_REFERENCE_CONTEXT_LIMIT", str(DEFAULT_REFERENCE_CONTEXT_LIMIT)
+    )
+    try:
+        reference_context_limit = int(reference_context_limit_raw)
+    except ValueError:
+        print(
+            f"Invalid INPUT_REFERENCE_CONTEXT_LIMIT value "
+            f"('{reference_context_limit_raw}'); falling back to "
+            f"{DEFAULT_REFERENCE_CONTEXT_LIMIT}"
+        )
+        reference_context_limit = DEFAULT_REFERENCE_CONTEXT_LIMIT
+
+    return _ActionInputs(
+        resources_paths=tuple(_split_csv_input(env("INPUT_RESOURCES_PATHS"))),
+        dry_run=env("INPUT_DRY_RUN", "false").lower() == "true",
+        log_trace=env("INPUT_LOG_TRACE", "false").lower() == "true",
+        llm_provider=llm_provider,
+        model=model,
+        api_key=api_key,
         # OpenRouter-specific settings
-        openrouter_site_url = os.environ.get(
+        openrouter_site_url=env(
             "INPUT_OPENROUTER_SITE_URL",
             "https://github.com/duartebarbosadev/AndroidResourceTranslator",
-        )
-        openrouter_site_name = os.environ.get(
+        ),
+        openrouter_site_name=env(
             "INPUT_OPENROUTER_SITE_NAME", "AndroidResourceTranslatorAction"
-        )
-        openrouter_send_site_info = (
-            os.environ.get("INPUT_OPENROUTER_SEND_SITE_INFO", "true").lower() == "true"
-        )
+        ),
+        openrouter_send_site_info=(
+            env("INPUT_OPENROUTER_SEND_SITE_INFO", "true").lower() == "true"
+        ),
+        project_context=env("INPUT_PROJECT_CONTEXT", ""),
+        include_reference_context=(
+            env("INPUT_INCLUDE_REFERENCE_CONTEXT", "true").lower() == "true"
+        ),
+        reference_context_limit=reference_context_limit,
+        ignore_folders=frozenset(_split_csv_input(env("INPUT_IGNORE_FOLDERS", ""))),
+        # Caching is opt-in for the action since runners start from a clean disk
+        cache_dir=env("INPUT_CACHE_DIR", "").strip() or None,
+    )
 
-        project_context = os.environ.get("INPUT_PROJECT_CONTEXT", "")
 
-        include_reference_context = (
-            os.environ.get("INPUT_INCLUDE_REFERENCE_CONTEXT", "true").lower() == "true"
-        )
-        reference_context_limit_raw = os.environ.get(
-            "INPUT_REFERENCE_CONTEXT_LIMIT", str(DEFAULT_REFERENCE_CONTEXT_LIMIT)
-        )
-        try:
-            reference_context_limit = int(reference_context_limit_raw)
-        except ValueError:
-            print(
-                f"Invalid INPUT_REFERENCE_CONTEXT_LIMIT value "
-                f"('{reference_context_limit_raw}'); falling back to "
-                f"{DEFAULT_REFERENCE_CONTEXT_LIMIT}"
-            )
-            reference_context_limit = DEFAULT_REFERENCE_CONTEXT_LIMIT
-
-        ignore_folders_input = os.environ.get("INPUT_IGNORE_FOLDERS", "")
-        ignore_folders = (
-            [
-                folder.strip()
-                for folder in ignore_folders_input.split(",")
-                if folder.strip()
-            ]
-            if ignore_folders_input
-            else []
-        )
+def main() -> None:
+    """
+    Main entry point for the Android Resource Translator script.
+    Parses command-line arguments or environment variables, finds resource files,
+    checks for missing translations, and auto-translates them.
+    """
+    is_github = os.environ.get("GITHUB_ACTIONS", "false").lower() == "true"
+    if is_github:
+        inputs = _parse_action_inputs(os.environ)
+        resources_paths = list(inputs.resources_paths)
+        dry_run = inputs.dry_run
+        log_trace = inputs.log_trace
+        llm_provider = inputs.llm_provider
+        model = inputs.model
+        api_key = inputs.api_key
+        openrouter_site_url = inputs.openrouter_site_url
+        openrouter_site_name = inputs.openrouter_site_name
+        openrouter_send_site_info = inputs.openrouter_send_site_info
+        project_context = inputs.project_context
+        include_reference_context = inputs.include_reference_context
+        reference_context_limit = inputs.reference_context_limit
+        ignore_folders = inputs.ignore_folders
+        cache_dir = inputs.cache_dir
 
         startup_message_prefix = "Running with parameters from environment variables."
 
@@ -1937,6 +2312,16 @@ def main() -> None:
             default=DEFAULT_REFERENCE_CONTEXT_LIMIT,
             help="Maximum number of existing translations to include as context (0 disables context).",
         )
+        parser.add_argument(
+            "--cache-dir",
+            default=DEFAULT_CACHE_DIR,
+            help=f"Directory for caching translations between runs (default: {DEFAULT_CACHE_DIR})",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Disable the on-disk translation cache",
+        )
 
         args = parser.parse_args()
 
@@ -1965,11 +2350,8 @@ def main() -> None:
             else True
         )
         reference_context_limit = args.reference_context_limit
-        ignore_folders = [
-            folder.strip()
-            for folder in args.ignore_folders.split(",")
-            if folder.strip()
-        ]
+        ignore_folders = frozenset(_split_csv_input(args.ignore_folders))
+        cache_dir = None if args.no_cache else args.cache_dir
         # Don't print args because it will come with the API KEY
         startup_message_prefix = "Running with command-line parameters."
 
@@ -1988,9 +2370,10 @@ def main() -> None:
         f"Resources Paths: {resources_paths}, Dry Run: {dry_run}, "
         f"Log Trace: {log_trace}, "
         f"LLM Provider: {llm_provider}, Model: {model}, "
-        f"Project Context: {project_context}, Ignore Folders: {ignore_folders}, "
+        f"Project Context: {project_context}, Ignore Folders: {sorted(ignore_folders)}, "
         f"Include Reference Context: {should_include_reference_context}, "
-        f"Reference Context Limit: {reference_context_limit}"
+        f"Reference Context Limit: {reference_context_limit}, "
+        f"Cache Dir: {cache_dir}"
     )
     if startup_message_prefix:
         print(f"{startup_message_prefix} {runtime_details}")
@@ -2033,24 +2416,40 @@ def main() -> None:
     if not resources_paths:
         print("Error: 'resources_paths' input not provided.")
         sys.exit(1)
-    for path in resources_paths:
-        if not os.path.exists(path):
-            logger.error(f"Error: The specified path {path} does not exist!")
-            sys.exit(1)
 
     # Merge resources from multiple resource directories.
-    merged_modules: Dict[str, AndroidModule] = {}
+    # The roots are scanned concurrently (the walks mostly wait on the filesystem)
+    # and merged in the order they were given.
+    # Every root is checked up front so a bad path fails before any scan starts.
     for res_path in resources_paths:
-        modules = find_resource_files(res_path, ignore_folders)
-        for identifier, mod in modules.items():
-            if identifier in merged_modules:
-                # Merge language_resources from modules with the same unique identifier.
-                for lang, resources in mod.language_resources.items():
-                    merged_modules[identifier].language_resources.setdefault(
-                        lang, []
-                    ).extend(resources)
-            else:
-                merged_modules[identifier] = mod
+        try:
+            with os.scandir(res_path):
+                pass
+        except OSError as e:
+            logger.error(
+                f"Error: The specified path {res_path} is not a readable directory "
+                f"({e.strerror or e})"
+            )
+            sys.exit(1)
+
+    merged_modules: Dict[str, AndroidModule] = {}
+    workers = min(MAX_ROOT_SCAN_WORKERS, len(resources_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        scans = [
+            executor.submit(find_resource_files, res_path, ignore_folders)
+            for res_path in resources_paths
+        ]
+        for scan in scans:
+            modules = scan.result()
+            for identifier, mod in modules.items():
+                existing = merged_modules.get(identifier)
+                if existing is None:
+                    merged_modules[identifier] = mod
+                else:
+                    # Merge language_resources from modules with the same unique identifier.
+                    merged_resources = existing.language_resources
+                    for lang, resources in mod.language_resources.items():
+                        merged_resources[lang].extend(resources)
 
     if not merged_modules:
         logger.error("No resource files found!")
@@ -2058,14 +2457,17 @@ def main() -> None:
 
     modules_count = len(merged_modules)
     resources_count = sum(
-        len(resources)
-        for mod in merged_modules.values()
-        for resources in mod.language_resources.values()
+        map(
+            len,
+            chain.from_iterable(
+                mod.language_resources.values() for mod in merged_modules.values()
+            ),
+        )
     )
     logger.info(f"Found {modules_count} modules with {resources_count} resource files")
 
     if log_trace:
-        for module in sorted(merged_modules.values(), key=lambda m: m.name):
+        for module in sorted(merged_modules.values(), key=attrgetter("name")):
             module.print_resources()
 
     updated_default_resources = detect_updated_default_resources(merged_modules)
@@ -2086,6 +2488,7 @@ def main() -> None:
                 send_site_info=openrouter_send_site_info
                 if llm_provider == "openrouter"
                 else True,
+                cache_dir=cache_dir,
             )
         except ValueError as e:
             logger.error(f"Error creating LLM configuration: {e}")
@@ -2104,21 +2507,22 @@ def main() -> None:
     # Whether or not auto-translation was performed, still check for missing translations.
     check_missing_translations(merged_modules)
 
-    # Generate the translation report (this will be empty if no auto-translation occurred).
-    report_output = create_translation_report(translation_log)
-
-    # Output the report
+    # Output the translation report (this will be empty if no auto-translation occurred).
     if "GITHUB_OUTPUT" in os.environ:
         with open(os.environ["GITHUB_OUTPUT"], "a", encoding="utf-8") as f:
             # Use a unique delimiter to prevent collision if translations contain "EOF"
             delimiter = "EOF_TRANSLATION_REPORT_9d8e7f6a"
-            print(f"translation_report<<{delimiter}", file=f)
-            print(report_output, file=f)
-            print(delimiter, file=f)
+            f.write(f"translation_report<<{delimiter}\n")
+            # Stream the report into the file instead of building it in memory first;
+            # the heredoc is always closed so a failure cannot corrupt later outputs.
+            try:
+                _emit_translation_report(translation_log, f.write)
+            finally:
+                f.write(f"\n{delimiter}\n")
     else:
         if not dry_run:
             print("\nTranslation Report:")
-            print(report_output)
+            print(create_translation_report(translation_log))
 
 
 if __name__ == "__main__":
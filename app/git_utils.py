@@ -8,8 +8,9 @@ to determine which files should be processed or ignored.
 
 import os
 import logging
+from functools import cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -121,6 +122,25 @@ def parse_gitignore(root_dir: str) -> List[str]:
     return parse_gitignore_file(gitignore_path)
 
 
+@cache
+def _compile_gitignore_spec(patterns: Tuple[str, ...]):
+    """
+    Compile gitignore patterns into a pathspec matcher, once per distinct pattern list.
+
+    Every strings.xml file is checked against the same few .gitignore files, so the
+    compiled matchers are shared instead of being rebuilt for each file.
+
+    Args:
+        patterns: The gitignore patterns, in file order
+
+    Returns:
+        A pathspec.PathSpec for the patterns
+    """
+    import pathspec
+
+    return pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, patterns)
+
+
 def is_ignored_by_gitignores(path: Path, all_gitignores: Dict[str, List[str]]) -> bool:
     """
     Check if a path matches any pattern from multiple .gitignore files with proper precedence.
@@ -137,8 +157,6 @@ def is_ignored_by_gitignores(path: Path, all_gitignores: Dict[str, List[str]]) -
     Returns:
         True if the path should be ignored, False otherwise
     """
-    import pathspec
-
     # Normalize the path
     path_str = str(path.resolve()).replace("\\", "/")
 
@@ -174,9 +192,7 @@ def is_ignored_by_gitignores(path: Path, all_gitignores: Dict[str, List[str]]) -
                 rel_path = ""
 
             # Use pathspec library to handle gitignore pattern matching
-            spec = pathspec.PathSpec.from_lines(
-                pathspec.patterns.GitWildMatchPattern, patterns
-            )
+            spec = _compile_gitignore_spec(tuple(patterns))
 
             # Check if the path should be ignored
             if spec.match_file(rel_path):
@@ -204,8 +220,6 @@ def is_ignored_by_gitignore(path: Path, gitignore_patterns: List[str]) -> bool:
     Returns:
         True if the path should be ignored according to any pattern, False otherwise
     """
-    import pathspec
-
     if not gitignore_patterns:
         return False
 
@@ -214,9 +228,7 @@ def is_ignored_by_gitignore(path: Path, gitignore_patterns: List[str]) -> bool:
 
     # Use pathspec library to handle gitignore pattern matching
     # Note: pathspec handles directory-based matching internally for patterns like "dir/"
-    spec = pathspec.PathSpec.from_lines(
-        pathspec.patterns.GitWildMatchPattern, gitignore_patterns
-    )
+    spec = _compile_gitignore_spec(tuple(gitignore_patterns))
 
     # Check if the path should be ignored
     # On Windows, convert backslashes to forward slashes for proper matching
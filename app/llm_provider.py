@@ -7,13 +7,26 @@ LLM providers (OpenAI, OpenRouter) using a unified interface. It handles
 provider-specific configurations, API endpoints, and authentication.
 """
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+from string_utils import format_placeholders
 
 logger = logging.getLogger(__name__)
 
+# OpenAI SDK clients keyed by (api_key, base_url). Each client owns an HTTP
+# connection pool, so sharing them keeps connections alive across batches.
+_CLIENT_CACHE: Dict[Tuple[str, str], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 
 # ------------------------------------------------------------------------------
 # Tool/Function Calling Schemas for Structured Outputs
@@ -186,6 +199,7 @@ class LLMConfig:
         site_url: Optional site URL for OpenRouter rankings
         site_name: Optional site name for OpenRouter rankings
         send_site_info: Whether to send site URL/name to OpenRouter (default: True)
+        cache_dir: Optional directory for the on-disk translation cache (None disables it)
     """
 
     provider: LLMProvider
@@ -194,6 +208,7 @@ class LLMConfig:
     site_url: Optional[str] = None
     site_name: Optional[str] = None
     send_site_info: bool = True
+    cache_dir: Optional[str] = None
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -243,27 +258,37 @@ class LLMClient:
         """
         Create and configure the OpenAI client for the selected provider.
 
+        Clients are cached per API key and base URL, so every LLMClient for the
+        same provider reuses one connection pool.
+
         Returns:
             Configured OpenAI client instance
 
         Raises:
             ImportError: If the OpenAI package is not installed
         """
-        try:
-            from openai import OpenAI
-        except ImportError:
-            logger.error(
-                "OpenAI package not installed. Please install it using 'pip install openai'."
-            )
-            raise ImportError(
-                "OpenAI package not installed. Run 'pip install openai' first."
-            )
-
         base_url = self.BASE_URLS[self.config.provider]
+        cache_key = (self.config.api_key, base_url)
+
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is None:
+                # Imported here so dry runs and --help never load the SDK
+                try:
+                    from openai import OpenAI
+                except ImportError:
+                    logger.error(
+                        "OpenAI package not installed. Please install it using 'pip install openai'."
+                    )
+                    raise ImportError(
+                        "OpenAI package not installed. Run 'pip install openai' first."
+                    )
 
-        logger.debug(f"Creating OpenAI client with base_url={base_url}")
+                logger.debug(f"Creating OpenAI client with base_url={base_url}")
+                client = OpenAI(api_key=self.config.api_key, base_url=base_url)
+                _CLIENT_CACHE[cache_key] = client
 
-        return OpenAI(api_key=self.config.api_key, base_url=base_url)
+        return client
 
     def _get_extra_headers(self) -> Dict[str, str]:
         """
@@ -293,6 +318,46 @@ class LLMClient:
 
         return {}
 
+    def _apply_prompt_cache_control(self, messages: list) -> list:
+        """
+        Mark the system message as a prompt-cache breakpoint where required.
+
+        OpenAI caches long, repeated prompt prefixes automatically, but Anthropic
+        models (served through OpenRouter) only cache content blocks explicitly
+        flagged with cache_control.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+
+        Returns:
+            The messages, with the system content wrapped in a cacheable block if needed
+        """
+        if not (
+            self.config.provider == LLMProvider.OPENROUTER
+            and self.config.model.startswith("anthropic/")
+        ):
+            return messages
+
+        cached_messages = []
+        for message in messages:
+            if (
+                isinstance(message, dict)
+                and message.get("role") == "system"
+                and isinstance(message.get("content"), str)
+            ):
+                message = {
+                    **message,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": message["content"],
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            cached_messages.append(message)
+        return cached_messages
+
     def chat_completion(
         self,
         messages: list,
@@ -327,6 +392,8 @@ class LLMClient:
                 f"tools: {'yes' if tools else 'no'})"
             )
 
+            messages = self._apply_prompt_cache_control(messages)
+
             # Prepare API call parameters
             api_params = {
                 "model": self.config.model,
@@ -412,8 +479,6 @@ class LLMClient:
                 logger.debug(f"Raw function arguments string: {arguments_str}")
 
                 # Parse the JSON arguments
-                import json
-
                 arguments = json.loads(arguments_str)
 
                 logger.debug(
@@ -454,6 +519,95 @@ class LLMClient:
             raise
 
 
+# ------------------------------------------------------------------------------
+# On-disk Translation Cache
+# ------------------------------------------------------------------------------
+
+
+def _translation_cache_path(
+    llm_config: LLMConfig, system_message: str, user_prompt: str, tool_name: str
+) -> Optional[Path]:
+    """
+    Return the cache file for a batch request, or None when caching is disabled.
+
+    The key covers everything that determines the model's answer: provider, model,
+    both prompts (which embed the source texts) and the tool schema used.
+    """
+    if not llm_config.cache_dir:
+        return None
+
+    key = hashlib.sha256(
+        "\0".join(
+            (
+                llm_config.provider.value,
+                llm_config.model,
+                system_message,
+                user_prompt,
+                tool_name,
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+    return Path(llm_config.cache_dir) / key[:2] / f"{key}.json"
+
+
+def _load_cached_translations(
+    cache_path: Optional[Path], requested: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Return previously validated translations for a request, if cached.
+
+    Entries that do not cover every requested key are treated as a miss.
+    """
+    if cache_path is None:
+        return None
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            translations = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable translation cache entry {cache_path}: {e}")
+        return None
+
+    if not isinstance(translations, dict):
+        return None
+
+    if not requested.keys() <= translations.keys():
+        logger.warning(f"Ignoring incomplete translation cache entry {cache_path}")
+        return None
+
+    logger.info(f"Reusing {len(translations)} cached translations from {cache_path}")
+    return translations
+
+
+def _store_cached_translations(
+    cache_path: Optional[Path], translations: Dict[str, Any]
+) -> None:
+    """
+    Atomically write validated translations to the cache.
+
+    Failures are logged and otherwise ignored; the cache must never fail a run.
+    """
+    if cache_path is None:
+        return
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=".tmp-", suffix=".json"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(translations, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write translation cache entry {cache_path}: {e}")
+
+
 def translate_with_llm(
     text: str, system_message: str, user_prompt: str, llm_config: LLMConfig
 ) -> str:
@@ -598,11 +752,7 @@ def translate_strings_batch_with_llm(
     if not strings_dict:
         return {}
 
-    client = LLMClient(llm_config)
-
     # Format the strings as JSON for the prompt
-    import json
-
     strings_json = json.dumps(strings_dict, indent=2, ensure_ascii=False)
 
     full_user_prompt = user_prompt
@@ -633,11 +783,23 @@ def translate_strings_batch_with_llm(
         {"role": "user", "content": full_user_prompt},
     ]
 
+    cache_path = _translation_cache_path(
+        llm_config,
+        system_message,
+        full_user_prompt,
+        TRANSLATE_STRINGS_BATCH_TOOL["function"]["name"],
+    )
+    cached_translations = _load_cached_translations(cache_path, strings_dict)
+    if cached_translations is not None:
+        return cached_translations
+
     logger.info(f"Batch translating {len(strings_dict)} strings in a single API call")
     logger.debug(f"System message length: {len(system_message)} chars")
     logger.debug(f"User prompt length: {len(full_user_prompt)} chars")
     logger.debug(f"First 200 chars of user prompt: {full_user_prompt[:200]}...")
 
+    client = LLMClient(llm_config)
+
     # Use function calling with structured output for guaranteed reliability
     result = client.chat_completion(
         messages=messages,
@@ -669,7 +831,7 @@ def translate_strings_batch_with_llm(
             logger.warning(f"Invalid translation item: {item}")
 
     # Validate that we got translations for all requested keys
-    missing_keys = set(strings_dict.keys()) - set(translations.keys())
+    missing_keys = strings_dict.keys() - translations.keys()
     if missing_keys:
         logger.error(
             "LLM did not provide translations for some keys: %s",
@@ -680,9 +842,92 @@ def translate_strings_batch_with_llm(
             + ", ".join(sorted(missing_keys))
         )
 
+    # Give translations that lost or altered a format placeholder one more try
+    mismatched = {
+        key: source_text
+        for key, source_text in strings_dict.items()
+        if format_placeholders(source_text) != format_placeholders(translations[key])
+    }
+    if mismatched:
+        translations.update(
+            _retry_placeholder_mismatches(
+                client, system_message, user_prompt, mismatched
+            )
+        )
+
+    _store_cached_translations(cache_path, translations)
     return translations
 
 
+def _retry_placeholder_mismatches(
+    client: LLMClient,
+    system_message: str,
+    user_prompt: str,
+    mismatched: Dict[str, str],
+) -> Dict[str, str]:
+    """
+    Re-request translations whose format placeholders differ from the source.
+
+    Args:
+        client: LLM client used for the original batch
+        system_message: System prompt of the original batch
+        user_prompt: Base user prompt of the original batch
+        mismatched: Dictionary mapping string keys to their source texts
+
+    Returns:
+        Dictionary with only the retried translations that preserve every
+        placeholder. Keys that still mismatch keep their first translation, and
+        a failed retry request returns an empty dictionary.
+    """
+    logger.warning(
+        "Retrying %d translations with mismatched format placeholders: %s",
+        len(mismatched),
+        sorted(mismatched),
+    )
+    retry_prompt = (
+        user_prompt
+        + "\n\nEarlier translations of the strings below dropped, added or changed "
+        + "format placeholders such as %s or %1$d. Translate them again and keep "
+        + "every placeholder from the source exactly as written:\n"
+        + json.dumps(mismatched, indent=2, ensure_ascii=False)
+    )
+    try:
+        result = client.chat_completion(
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": retry_prompt},
+            ],
+            tools=[TRANSLATE_STRINGS_BATCH_TOOL],
+            tool_choice="required",
+            temperature=0,
+        )
+    except Exception as e:
+        # The retry is best effort; keep the first-pass translations on failure
+        logger.warning(
+            "Placeholder retry failed, keeping the original translations: %s", e
+        )
+        return {}
+
+    corrected = {}
+    for item in result.get("translations", []):
+        key = item.get("key")
+        translation = item.get("translation")
+        if (
+            key in mismatched
+            and translation is not None
+            and format_placeholders(translation) == format_placeholders(mismatched[key])
+        ):
+            corrected[key] = translation
+
+    still_mismatched = mismatched.keys() - corrected.keys()
+    if still_mismatched:
+        logger.warning(
+            "Keeping translations with mismatched format placeholders for: %s",
+            sorted(still_mismatched),
+        )
+    return corrected
+
+
 def translate_plurals_batch_with_llm(
     plurals_dict: Dict[str, Dict[str, str]],
     system_message: str,
@@ -714,11 +959,7 @@ def translate_plurals_batch_with_llm(
     if not plurals_dict:
         return {}
 
-    client = LLMClient(llm_config)
-
     # Format the plurals as JSON for the prompt
-    import json
-
     plurals_json = json.dumps(plurals_dict, indent=2, ensure_ascii=False)
 
     full_user_prompt = user_prompt
@@ -748,8 +989,20 @@ def translate_plurals_batch_with_llm(
         {"role": "user", "content": full_user_prompt},
     ]
 
+    cache_path = _translation_cache_path(
+        llm_config,
+        system_message,
+        full_user_prompt,
+        TRANSLATE_PLURALS_BATCH_TOOL["function"]["name"],
+    )
+    cached_translations = _load_cached_translations(cache_path, plurals_dict)
+    if cached_translations is not None:
+        return cached_translations
+
     logger.info(f"Batch translating {len(plurals_dict)} plurals in a single API call")
 
+    client = LLMClient(llm_config)
+
     # Use function calling with structured output for guaranteed reliability
     result = client.chat_completion(
         messages=messages,
@@ -778,7 +1031,7 @@ def translate_plurals_batch_with_llm(
             logger.warning(f"Invalid plural translation item: {item}")
 
     # Validate that we got translations for all requested plural names
-    missing_plurals = set(plurals_dict.keys()) - set(translations.keys())
+    missing_plurals = plurals_dict.keys() - translations.keys()
     if missing_plurals:
         logger.warning(
             f"LLM did not provide translations for some plurals: {missing_plurals}"
@@ -799,4 +1052,7 @@ def translate_plurals_batch_with_llm(
                     f"Using '{first_key}' value as 'other' fallback for '{plural_name}'"
                 )
 
+    # Partial batches are still returned, but only complete ones are replayed later
+    if not missing_plurals:
+        _store_cached_translations(cache_path, translations)
     return translations
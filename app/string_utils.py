@@ -8,6 +8,7 @@ __all__ = [
     "escape_apostrophes",
     "escape_double_quotes",
     "escape_special_chars",
+    "format_placeholders",
 ]
 
 # Characters that can follow a backslash to form escape sequences:
@@ -76,6 +77,17 @@ def escape_double_quotes(text: Optional[str]) -> Optional[str]:
     return _escape_character(text, '"')
 
 
+def format_placeholders(text: Optional[str]) -> List[str]:
+    """Return the sorted printf-style placeholders in text, ignoring literal %%."""
+    if not text:
+        return []
+    return sorted(
+        match.group(0)
+        for match in _PERCENT_PLACEHOLDER_PATTERN.finditer(text)
+        if not match.group(0).endswith("%")
+    )
+
+
 def _normalize_reference_text(reference_text: Optional[str]) -> Optional[str]:
     if reference_text is None:
         return None
@@ -16,6 +16,7 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from AndroidResourceTranslator import (
+    _emit_translation_report,
     create_translation_report,
     check_missing_translations,
     AndroidResourceFile,
@@ -125,6 +126,65 @@ class TestReporting(unittest.TestCase):
         self.assertIn("| hello | Hello | Hola |", report)
         self.assertIn("| hello | Hello | Bonjour |", report)
 
+    def test_create_translation_report_sorts_languages_and_entries(self):
+        """Report order should not depend on the order entries were logged."""
+        translation_log = {
+            "test_module": {
+                "fr": {
+                    "strings": [
+                        {"key": "hello", "source": "Hello", "translation": "Bonjour"}
+                    ],
+                    "plurals": [],
+                },
+                "es": {
+                    "strings": [
+                        {"key": "hello", "source": "Hello", "translation": "Hola"},
+                        {"key": "bye", "source": "Bye", "translation": "Adiós"},
+                    ],
+                    "plurals": [],
+                },
+            }
+        }
+
+        report = create_translation_report(translation_log)
+
+        self.assertLess(
+            report.index("### Language: Spanish"), report.index("### Language: French")
+        )
+        self.assertLess(
+            report.index("| bye |"), report.index("| hello | Hello | Hola |")
+        )
+
+    def test_emit_translation_report_matches_string_report(self):
+        """Streaming the report should write exactly the string report."""
+        translation_log = {
+            "test_module": {
+                "es": {
+                    "strings": [
+                        {
+                            "key": "hello",
+                            "source": "Hello\nWorld",
+                            "translation": "Hola\nMundo",
+                        }
+                    ],
+                    "plurals": [
+                        {
+                            "plural_name": "days",
+                            "translations": {"one": "%d día", "other": "%d días"},
+                        }
+                    ],
+                },
+                "fr": {"strings": [], "plurals": []},
+            }
+        }
+
+        chunks = []
+        _emit_translation_report(translation_log, chunks.append)
+
+        self.assertEqual("".join(chunks), create_translation_report(translation_log))
+        self.assertIn("| hello | Hello World | Hola Mundo |", "".join(chunks))
+        self.assertNotIn("French", "".join(chunks))
+
     @patch("AndroidResourceTranslator.AndroidResourceFile.parse_file")
     def test_check_missing_translations_none_missing(self, mock_parse_file):
         """Test checking for missing translations when all are present."""
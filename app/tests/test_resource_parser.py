@@ -15,11 +15,13 @@ import sys
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path for module import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from AndroidResourceTranslator import (
+    main,
     find_resource_files,
     AndroidResourceFile,
     detect_language_from_path,
@@ -86,6 +88,82 @@ class TestFindResourceFiles(TestResourceParser):
         modules = find_resource_files(self.temp_dir)
         self.assertEqual(len(modules), 0, "Empty directory should return no modules")
 
+    def test_missing_directory_raises(self):
+        """A resources path that does not exist should be reported, not skipped."""
+        with self.assertRaises(FileNotFoundError):
+            find_resource_files(os.path.join(self.temp_dir, "missing"))
+
+    def test_unreadable_root_exits_cleanly(self):
+        """An unlistable resources path should exit with an error, not a traceback."""
+        permission_error = PermissionError(13, "Permission denied", self.temp_dir)
+        argv = ["AndroidResourceTranslator.py", "--dry-run", self.temp_dir]
+
+        with patch.object(sys, "argv", argv), patch.dict(os.environ, clear=True):
+            with patch(
+                "AndroidResourceTranslator.os.scandir", side_effect=permission_error
+            ):
+                with self.assertLogs("AndroidResourceTranslator", "ERROR") as logs:
+                    with self.assertRaises(SystemExit) as exit_context:
+                        main()
+
+        self.assertEqual(exit_context.exception.code, 1)
+        self.assertIn("Permission denied", "\n".join(logs.output))
+
+    def test_bad_root_fails_before_any_scan(self):
+        """A missing resources path should stop the run before any root is scanned."""
+        missing_dir = os.path.join(self.temp_dir, "missing")
+        argv = [
+            "AndroidResourceTranslator.py",
+            "--dry-run",
+            self.temp_dir,
+            missing_dir,
+        ]
+
+        with patch.object(sys, "argv", argv), patch.dict(os.environ, clear=True):
+            with patch("AndroidResourceTranslator.find_resource_files") as scan:
+                with self.assertLogs("AndroidResourceTranslator", "ERROR") as logs:
+                    with self.assertRaises(SystemExit) as exit_context:
+                        main()
+
+        self.assertEqual(exit_context.exception.code, 1)
+        scan.assert_not_called()
+        self.assertIn(missing_dir, "\n".join(logs.output))
+
+    def test_symlinked_directories_are_not_followed(self):
+        """Symlinked folders should not be scanned, so resources are not duplicated."""
+        module_dir = os.path.join(self.temp_dir, "app")
+        self.create_strings_xml(
+            os.path.join(module_dir, "src", "main", "res", "values", "strings.xml")
+        )
+        os.symlink(module_dir, os.path.join(self.temp_dir, "app_link"))
+
+        modules = find_resource_files(self.temp_dir)
+
+        self.assertEqual(len(modules), 1)
+        self.assertEqual(
+            len(list(modules.values())[0].language_resources["default"]), 1
+        )
+
+    def test_tooling_directories_are_not_scanned(self):
+        """Folders such as .git and .gradle should be pruned from the walk."""
+        for tooling_dir in (".git", ".gradle"):
+            self.create_strings_xml(
+                os.path.join(
+                    self.temp_dir,
+                    tooling_dir,
+                    "cache",
+                    "src",
+                    "main",
+                    "res",
+                    "values",
+                    "strings.xml",
+                )
+            )
+
+        modules = find_resource_files(self.temp_dir)
+
+        self.assertEqual(modules, {})
+
     def test_simple_structure(self):
         """Test finding resources in a simple Android structure."""
         # Create module structure: module1/src/main/res/values/strings.xml
@@ -424,6 +502,51 @@ class TestResourceParsing(TestResourceParser):
         expected = 'Visit our <a href="https://example.com">website</a> for more info'
         self.assertEqual(resource_file.strings["html_link"], expected)
 
+    def test_parsing_ignores_non_resource_siblings(self):
+        """Comments and other resource types between entries should not be parsed."""
+        xml_path = os.path.join(self.temp_dir, "values", "strings.xml")
+        content = """<resources>
+    <!-- Leading comment -->
+    <string name="first">First</string>
+    <string-array name="options">
+        <item>Option</item>
+    </string-array>
+    <string name="second">Second <b>bold</b> <i>italic</i></string>
+    <plurals name="count">
+        <item quantity="other">%d things</item>
+    </plurals>
+</resources>"""
+        self.create_strings_xml(xml_path, content=content)
+
+        resource_file = AndroidResourceFile(Path(xml_path), "default")
+
+        self.assertEqual(
+            resource_file.strings,
+            {"first": "First", "second": "Second <b>bold</b> <i>italic</i>"},
+        )
+        self.assertEqual(resource_file.plurals, {"count": {"other": "%d things"}})
+
+    def test_identical_files_are_parsed_independently(self):
+        """Files sharing cached content must not share mutable dictionaries."""
+        content = """<resources>
+    <string name="hello">Hello</string>
+    <plurals name="count">
+        <item quantity="other">%d things</item>
+    </plurals>
+</resources>"""
+        first_path = os.path.join(self.temp_dir, "app", "values", "strings.xml")
+        second_path = os.path.join(self.temp_dir, "lib", "values", "strings.xml")
+        self.create_strings_xml(first_path, content=content)
+        self.create_strings_xml(second_path, content=content)
+
+        first = AndroidResourceFile(Path(first_path), "default")
+        first.strings["hello"] = "Changed"
+        first.plurals["count"]["other"] = "Changed"
+        second = AndroidResourceFile(Path(second_path), "default")
+
+        self.assertEqual(second.strings, {"hello": "Hello"})
+        self.assertEqual(second.plurals, {"count": {"other": "%d things"}})
+
     def test_update_xml_file_preserves_markup(self):
         """Ensure update_xml_file writes strings with markup without escaping."""
         with tempfile.TemporaryDirectory() as tmp_dir:
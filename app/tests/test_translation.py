@@ -31,7 +31,14 @@ from string_utils import (
     escape_double_quotes,
     escape_special_chars,
 )
-from llm_provider import LLMConfig, LLMProvider, translate_strings_batch_with_llm
+import llm_provider
+from llm_provider import (
+    LLMClient,
+    LLMConfig,
+    LLMProvider,
+    translate_plurals_batch_with_llm,
+    translate_strings_batch_with_llm,
+)
 
 
 class TestSpecialCharacterEscaping(unittest.TestCase):
@@ -508,7 +515,7 @@ class TestAutoTranslation(unittest.TestCase):
         mock_update_xml.assert_not_called()
         self.assertFalse(sv_resource.modified)
         self.assertEqual(sv_resource.plurals["days"]["few"], "%d dagar")
-        self.assertEqual(result["test_module"]["sv"]["plurals"], [])
+        self.assertEqual(result, {})
 
     @patch("AndroidResourceTranslator.translate_plurals_batch_with_llm")
     @patch("AndroidResourceTranslator.translate_strings_batch_with_llm")
@@ -552,7 +559,98 @@ class TestAutoTranslation(unittest.TestCase):
         mock_update_xml.assert_not_called()
         self.assertFalse(target_resource.modified)
         self.assertEqual(target_resource.plurals["days"], {"other": "%d dias"})
-        self.assertEqual(result["test_module"]["pt"]["plurals"], [])
+        self.assertEqual(result, {})
+
+    @patch("AndroidResourceTranslator.translate_plurals_batch_with_llm")
+    @patch("AndroidResourceTranslator.translate_strings_batch_with_llm")
+    @patch("AndroidResourceTranslator.update_xml_file")
+    def test_auto_translate_handles_multiple_languages(
+        self,
+        mock_update_xml,
+        mock_translate_strings_batch,
+        mock_translate_plurals_batch,
+    ):
+        """Each language should be translated and logged independently."""
+        fr_resource = MagicMock()
+        fr_resource.strings = {}
+        fr_resource.plurals = {"days": {"one": "%d jour", "other": "%d jours"}}
+        fr_resource.modified = False
+        self.module.add_resource("fr", fr_resource)
+
+        def translate_strings(strings_dict, system_message, **kwargs):
+            suffix = "fr" if "French" in system_message else "es"
+            return {key: f"{value} ({suffix})" for key, value in strings_dict.items()}
+
+        mock_translate_strings_batch.side_effect = translate_strings
+        mock_translate_plurals_batch.return_value = {
+            "days": {"one": "%d día", "other": "%d días"}
+        }
+
+        llm_config = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="test_api_key", model="test-model"
+        )
+
+        result = auto_translate_resources(
+            self.modules,
+            llm_config=llm_config,
+            project_context="Test project",
+        )
+
+        self.assertEqual(mock_translate_strings_batch.call_count, 2)
+        self.assertEqual(mock_update_xml.call_count, 2)
+        self.assertEqual(self.es_resource.strings["goodbye"], "Goodbye (es)")
+        self.assertEqual(fr_resource.strings["hello"], "Hello World (fr)")
+        self.assertEqual(
+            [entry["key"] for entry in result["test_module"]["fr"]["strings"]],
+            ["goodbye", "hello"],
+        )
+        self.assertEqual(result["test_module"]["fr"]["plurals"], [])
+        self.assertEqual(len(result["test_module"]["es"]["plurals"]), 1)
+
+    @patch("AndroidResourceTranslator.translate_strings_batch_with_llm")
+    @patch("AndroidResourceTranslator.update_xml_file")
+    def test_auto_translate_reuses_identical_strings_across_modules(
+        self,
+        mock_update_xml,
+        mock_translate_strings_batch,
+    ):
+        """The same source text should only be translated once per language."""
+        modules = {}
+        es_resources = []
+        for name in ("app", "feature"):
+            module = AndroidModule(name, f"{name}_id")
+            default_resource = MagicMock()
+            default_resource.strings = {"cancel": "Cancel"}
+            default_resource.plurals = {}
+            es_resource = MagicMock()
+            es_resource.strings = {}
+            es_resource.plurals = {}
+            es_resource.modified = False
+            module.add_resource("default", default_resource)
+            module.add_resource("es", es_resource)
+            modules[module.identifier] = module
+            es_resources.append(es_resource)
+
+        mock_translate_strings_batch.return_value = {"cancel": "Cancelar"}
+
+        llm_config = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="test_api_key", model="test-model"
+        )
+
+        result = auto_translate_resources(
+            modules,
+            llm_config=llm_config,
+            project_context="Test project",
+        )
+
+        mock_translate_strings_batch.assert_called_once()
+        for es_resource in es_resources:
+            self.assertEqual(es_resource.strings["cancel"], "Cancelar")
+        self.assertEqual(mock_update_xml.call_count, 2)
+        self.assertEqual(
+            result["feature"]["es"]["strings"],
+            [{"key": "cancel", "source": "Cancel", "translation": "Cancelar"}],
+        )
 
     @patch("AndroidResourceTranslator.translate_strings_batch_with_llm")
     @patch("AndroidResourceTranslator.update_xml_file")
@@ -607,6 +705,286 @@ class TestBatchTranslationSafety(unittest.TestCase):
                     llm_config=llm_config,
                 )
 
+    def test_translate_strings_batch_retries_placeholder_mismatches(self):
+        """Translations that drop a placeholder should be requested once more."""
+        responses = [
+            {
+                "translations": [
+                    {"key": "hello", "translation": "Hola"},
+                    {"key": "count", "translation": "Tienes mensajes"},
+                ]
+            },
+            {"translations": [{"key": "count", "translation": "Tienes %d mensajes"}]},
+        ]
+
+        class FakeClient:
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                return responses.pop(0)
+
+        llm_config = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="test_api_key", model="test-model"
+        )
+
+        with patch("llm_provider.LLMClient", FakeClient):
+            translations = translate_strings_batch_with_llm(
+                strings_dict={"hello": "Hello", "count": "You have %d messages"},
+                system_message="System",
+                user_prompt="Prompt",
+                llm_config=llm_config,
+            )
+
+        self.assertEqual(translations, {"hello": "Hola", "count": "Tienes %d mensajes"})
+        self.assertEqual(responses, [])
+
+
+class TestTranslationCache(unittest.TestCase):
+    """Tests for the on-disk cache of validated batch translations."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.llm_config = LLMConfig(
+            provider=LLMProvider.OPENAI,
+            api_key="test_api_key",
+            model="test-model",
+            cache_dir=self.cache_dir.name,
+        )
+
+    def _translate(self, client_class):
+        with patch("llm_provider.LLMClient", client_class):
+            return translate_strings_batch_with_llm(
+                strings_dict={"hello": "Hello"},
+                system_message="System",
+                user_prompt="Prompt",
+                llm_config=self.llm_config,
+            )
+
+    def test_repeated_batch_is_served_from_cache(self):
+        """A second identical request should not reach the LLM."""
+
+        class FakeClient:
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                return {"translations": [{"key": "hello", "translation": "Hola"}]}
+
+        class FailingClient:
+            def __init__(self, config):
+                raise AssertionError("LLM should not be called on a cache hit")
+
+        self.assertEqual(self._translate(FakeClient), {"hello": "Hola"})
+        self.assertEqual(self._translate(FailingClient), {"hello": "Hola"})
+
+    def test_failed_placeholder_retry_keeps_and_caches_first_pass(self):
+        """A failing retry request should not discard the validated batch."""
+
+        class RetryFailingClient:
+            calls = 0
+
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                RetryFailingClient.calls += 1
+                if RetryFailingClient.calls > 1:
+                    raise RuntimeError("429 rate limited")
+                return {
+                    "translations": [
+                        {"key": "hello", "translation": "Hola"},
+                        {"key": "count", "translation": "Tienes mensajes"},
+                    ]
+                }
+
+        class FailingClient:
+            def __init__(self, config):
+                raise AssertionError("LLM should not be called on a cache hit")
+
+        strings_dict = {"hello": "Hello", "count": "You have %d messages"}
+        expected = {"hello": "Hola", "count": "Tienes mensajes"}
+
+        for client_class in (RetryFailingClient, FailingClient):
+            with patch("llm_provider.LLMClient", client_class):
+                translations = translate_strings_batch_with_llm(
+                    strings_dict=strings_dict,
+                    system_message="System",
+                    user_prompt="Prompt",
+                    llm_config=self.llm_config,
+                )
+            self.assertEqual(translations, expected)
+
+        self.assertEqual(RetryFailingClient.calls, 2)
+
+    def test_incomplete_batch_is_not_cached(self):
+        """Responses that fail validation must not be replayed on the next run."""
+
+        class IncompleteClient:
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                return {"translations": [{"key": "other", "translation": "Otro"}]}
+
+        with self.assertRaises(ValueError):
+            self._translate(IncompleteClient)
+
+        self.assertEqual(list(Path(self.cache_dir.name).rglob("*.json")), [])
+
+    def test_partial_plural_batch_is_not_cached(self):
+        """Plural batches missing requested names must reach the LLM again."""
+        calls = []
+
+        class PartialPluralClient:
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                calls.append(kwargs)
+                return {
+                    "translations": [
+                        {"plural_name": "days", "quantities": {"other": "%d días"}}
+                    ]
+                }
+
+        for _ in range(2):
+            with patch("llm_provider.LLMClient", PartialPluralClient):
+                translations = translate_plurals_batch_with_llm(
+                    plurals_dict={
+                        "days": {"other": "%d days"},
+                        "hours": {"other": "%d hours"},
+                    },
+                    system_message="System",
+                    user_prompt="Prompt",
+                    llm_config=self.llm_config,
+                )
+            self.assertEqual(translations, {"days": {"other": "%d días"}})
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(list(Path(self.cache_dir.name).rglob("*.json")), [])
+
+    def test_cache_entry_missing_requested_keys_is_a_miss(self):
+        """Cached results that do not cover the request should be ignored."""
+
+        class FakeClient:
+            calls = 0
+
+            def __init__(self, config):
+                pass
+
+            def chat_completion(self, **kwargs):
+                FakeClient.calls += 1
+                return {"translations": [{"key": "hello", "translation": "Hola"}]}
+
+        self._translate(FakeClient)
+        (cache_file,) = Path(self.cache_dir.name).rglob("*.json")
+        cache_file.write_text('{"other": "Otro"}', encoding="utf-8")
+
+        self.assertEqual(self._translate(FakeClient), {"hello": "Hola"})
+        self.assertEqual(FakeClient.calls, 2)
+
+
+class TestClientReuse(unittest.TestCase):
+    """Tests for sharing SDK clients between LLMClient instances."""
+
+    def setUp(self):
+        llm_provider._CLIENT_CACHE.clear()
+        self.addCleanup(llm_provider._CLIENT_CACHE.clear)
+
+    @patch("openai.OpenAI")
+    def test_clients_share_sdk_client_per_provider_and_key(self, mock_openai):
+        """Repeated clients for the same credentials should reuse one connection pool."""
+        mock_openai.side_effect = lambda **kwargs: MagicMock()
+        config = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="test_api_key", model="test-model"
+        )
+        other_key = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="other_api_key", model="test-model"
+        )
+
+        first = LLMClient(config)
+        second = LLMClient(config)
+        third = LLMClient(other_key)
+
+        self.assertIs(first.client, second.client)
+        self.assertIsNot(first.client, third.client)
+        self.assertEqual(mock_openai.call_count, 2)
+
+
+class TestPromptCaching(unittest.TestCase):
+    """Tests for prompt layout and cache hints sent to the LLM provider."""
+
+    def _make_client(self, provider, model):
+        config = LLMConfig(provider=provider, api_key="test_api_key", model=model)
+        with patch.object(LLMClient, "_create_client", return_value=MagicMock()):
+            return LLMClient(config)
+
+    def test_anthropic_models_mark_system_message_cacheable(self):
+        """Anthropic models on OpenRouter need an explicit cache breakpoint."""
+        client = self._make_client(LLMProvider.OPENROUTER, "anthropic/claude-sonnet")
+        messages = [
+            {"role": "system", "content": "Guidelines"},
+            {"role": "user", "content": "Prompt"},
+        ]
+
+        cached = client._apply_prompt_cache_control(messages)
+
+        self.assertEqual(
+            cached[0]["content"],
+            [
+                {
+                    "type": "text",
+                    "text": "Guidelines",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        )
+        self.assertEqual(cached[1], messages[1])
+        self.assertEqual(messages[0]["content"], "Guidelines")
+
+    def test_other_models_keep_plain_messages(self):
+        """Providers with automatic prefix caching receive the messages unchanged."""
+        client = self._make_client(LLMProvider.OPENAI, "gpt-4o-mini")
+        messages = [{"role": "system", "content": "Guidelines"}]
+
+        self.assertIs(client._apply_prompt_cache_control(messages), messages)
+
+    @patch("AndroidResourceTranslator.translate_plurals_batch_with_llm")
+    @patch("AndroidResourceTranslator.translate_strings_batch_with_llm")
+    @patch("AndroidResourceTranslator.update_xml_file")
+    def test_guidelines_are_sent_in_system_message(
+        self,
+        mock_update_xml,
+        mock_translate_strings_batch,
+        mock_translate_plurals_batch,
+    ):
+        """The stable guidelines should prefix the system message, not the user prompt."""
+        module = AndroidModule("test_module", "test_id")
+        default_resource = MagicMock()
+        default_resource.strings = {"hello": "Hello"}
+        default_resource.plurals = {}
+        es_resource = MagicMock()
+        es_resource.strings = {}
+        es_resource.plurals = {}
+        es_resource.modified = False
+        module.add_resource("default", default_resource)
+        module.add_resource("es", es_resource)
+        mock_translate_strings_batch.return_value = {"hello": "Hola"}
+
+        llm_config = LLMConfig(
+            provider=LLMProvider.OPENAI, api_key="test_api_key", model="test-model"
+        )
+        auto_translate_resources(
+            {"test_id": module}, llm_config=llm_config, project_context=""
+        )
+
+        kwargs = mock_translate_strings_batch.call_args.kwargs
+        self.assertIn("Follow these guidelines carefully.", kwargs["system_message"])
+        self.assertNotIn("Follow these guidelines carefully.", kwargs["user_prompt"])
+        self.assertIn("Spanish", kwargs["user_prompt"])
+
 
 if __name__ == "__main__":
     unittest.main()